@@ -0,0 +1,219 @@
+#!/usr/bin/env python
+"""
+Compare memory use and parse time of the raw dicts returned by
+    iControlREST against the py5.models wrappers.
+
+The payloads are generated here to look like what an 11.5 F5 hands
+    back for get_all_nodes(), get_all_pools() and
+    get_all_pools(expand_subcollections=True), so no F5 is needed to
+    run it.
+
+Besides the raw dicts, every collection is also loaded as "trimmed
+    dicts": the same keys dropped and values interned as the models do,
+    but kept in plain dicts. The gap between that and the models is
+    what the slots themselves buy.
+
+Memory is measured with tracemalloc, which requires Python 3.4+.
+
+Sample call:
+    python examples/bench_models.py --count 5000
+
+Author: Corwin Brown
+"""
+
+import os
+import gc
+import sys
+import json
+import argparse
+import timeit
+import tracemalloc
+try:
+    from sys import intern
+except ImportError:
+    pass
+try:
+    from py5 import Node, Pool
+    from py5.models import READ_ONLY_KEYS, INTERNED_KEYS
+except ImportError:
+    sys.path.append(
+        os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+    from py5 import Node, Pool
+    from py5.models import READ_ONLY_KEYS, INTERNED_KEYS
+
+
+SELF_LINK = 'https://localhost/mgmt/tm/ltm/{0}?ver=11.5.1'
+
+
+def make_node(i):
+    name = 'node-{0:05d}'.format(i)
+    return {
+        'kind': 'tm:ltm:node:nodestate',
+        'name': name,
+        'partition': 'Common',
+        'fullPath': '/Common/{0}'.format(name),
+        'generation': 1,
+        'selfLink': SELF_LINK.format('node/~Common~{0}'.format(name)),
+        'address': '10.{0}.{1}.{2}'.format(i >> 16 & 255,
+                                           i >> 8 & 255,
+                                           i & 255),
+        'connectionLimit': 0,
+        'dynamicRatio': 1,
+        'ephemeral': 'false',
+        'fqdn': {
+            'addressFamily': 'ipv4',
+            'autopopulate': 'disabled',
+            'downInterval': 5,
+            'interval': 3600
+        },
+        'logging': 'disabled',
+        'monitor': 'default',
+        'rateLimit': 'disabled',
+        'ratio': 1,
+        'session': 'monitor-enabled',
+        'state': 'up'
+    }
+
+
+def make_pool(i, member_count=4, expand=False):
+    name = 'pool-{0:05d}'.format(i)
+    members = list()
+    for j in range(member_count):
+        member = make_node(i * member_count + j)
+        member['name'] += ':80'
+        member['kind'] = 'tm:ltm:pool:members:membersstate'
+        member['selfLink'] = SELF_LINK.format(
+            'pool/~Common~{0}/members/~Common~{1}'.format(name,
+                                                         member['name']))
+        members.append(member)
+
+    return {
+        'kind': 'tm:ltm:pool:poolstate',
+        'name': name,
+        'partition': 'Common',
+        'fullPath': '/Common/{0}'.format(name),
+        'generation': 1,
+        'selfLink': SELF_LINK.format('pool/~Common~{0}'.format(name)),
+        'allowNat': 'yes',
+        'allowSnat': 'yes',
+        'ignorePersistedWeight': 'disabled',
+        'ipTosToClient': 'pass-through',
+        'ipTosToServer': 'pass-through',
+        'linkQosToClient': 'pass-through',
+        'linkQosToServer': 'pass-through',
+        'loadBalancingMode': 'round-robin',
+        'minActiveMembers': 0,
+        'minUpMembers': 0,
+        'minUpMembersAction': 'failover',
+        'minUpMembersChecking': 'disabled',
+        'monitor': '/Common/http',
+        'queueDepthLimit': 0,
+        'queueOnConnectionLimit': 'disabled',
+        'queueTimeLimit': 0,
+        'reselectTries': 0,
+        'slowRampTime': 10,
+        'membersReference': dict(
+            {
+                'link': SELF_LINK.format(
+                    'pool/~Common~{0}/members'.format(name)),
+                'isSubcollection': True
+            },
+            **({'items': members} if expand else {}))
+    }
+
+
+def measure(build, repeat):
+    """
+    Return (bytes still allocated by build's result, best wall time).
+    """
+
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+
+    best = min(timeit.repeat(build, number=1, repeat=repeat))
+
+    return size, best
+
+
+def trim(item):
+    """
+    Drop and intern the same keys the models do, but keep a plain dict.
+    """
+
+    trimmed = dict((key, intern(value)
+                    if key in INTERNED_KEYS and isinstance(value, str)
+                    else value)
+                   for key, value in item.items()
+                   if key not in READ_ONLY_KEYS and
+                   not key.endswith('Reference'))
+
+    members = item.get('membersReference', {}).get('items')
+    if members is not None:
+        trimmed['members'] = [trim(member) for member in members]
+
+    return trimmed
+
+
+def trim_collection(collection):
+    return [trim(item) for item in collection['items']]
+
+
+def read_dict_fields(items):
+    for item in items:
+        (item['name'], item['partition'], item['address'],
+         item['session'], item['state'])
+
+
+def read_model_fields(models):
+    for model in models:
+        (model.name, model.partition, model.address,
+         model.session, model.state)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--count', type=int, default=5000,
+                        help='Number of nodes/pools to generate.')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='Timing runs to take the best of.')
+    args = parser.parse_args()
+
+    count = range(args.count)
+    collections = [
+        ('nodes', Node, json.dumps({'items': [make_node(i) for i in count]})),
+        ('pools', Pool, json.dumps({'items': [make_pool(i) for i in count]})),
+        ('pools, expanded', Pool,
+         json.dumps({'items': [make_pool(i, expand=True) for i in count]})),
+    ]
+
+    print('{0} objects, best of {1}, parse time includes json.loads'
+          .format(args.count, args.repeat))
+    print('{0:<18}{1:<16}{2:>10}{3:>12}'.format('', '', 'MiB', 'ms'))
+    for collection, model, text in collections:
+        cases = [
+            ('dict', lambda: json.loads(text)),
+            ('trimmed dict', lambda: trim_collection(json.loads(text))),
+            (model.__name__,
+             lambda: model.from_collection(json.loads(text))),
+        ]
+        for label, build in cases:
+            size, best = measure(build, args.repeat)
+            print('{0:<18}{1:<16}{2:>10.2f}{3:>12.1f}'
+                  .format(collection, label, size / 2.0 ** 20, best * 1000))
+
+    nodes = collections[0][2]
+    node_dicts = json.loads(nodes)['items']
+    node_models = Node.from_collection(json.loads(nodes))
+    print('\nReading name/partition/address/session/state off every node')
+    for label, read in [('dict', lambda: read_dict_fields(node_dicts)),
+                        ('Node', lambda: read_model_fields(node_models))]:
+        best = min(timeit.repeat(read, number=1, repeat=args.repeat))
+        print('{0:<18}{1:<16}{2:>22.2f}'.format('nodes', label, best * 1000))
+
+
+if __name__ == '__main__':
+    main()
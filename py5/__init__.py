@@ -3,3 +3,4 @@ Very simple wrapper around the iControl REST API.
 """
 
 from .py5 import iControlREST
+from .models import Pool, PoolMember, Node, Partition
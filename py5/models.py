@@ -0,0 +1,310 @@
+"""
+Optional typed wrappers around the raw dicts returned by iControlREST.
+
+Every getter on iControlREST hands back the decoded JSON as-is, which
+    is handy but heavy when you're holding thousands of pools, members
+    and nodes in a long running process. These classes are a more
+    compact alternative:
+
+    * The common fields (name, partition, address, session, state, ...)
+        live in real __slots__, so reading them is a plain attribute
+        lookup.
+    * Everything else the F5 will take back in a PUT is kept in one
+        small per-object dict, available through get().
+    * The per-object metadata (kind, selfLink, generation, fullPath
+        and the *Reference links) is dropped.
+    * Values that only ever come from a short list ('Common', 'up',
+        'round-robin', ...) are interned so every object shares a copy.
+
+All of that happens up front, when the model is built. Holding on to
+    the raw response so fields could be decoded on demand would keep
+    all of the metadata alive too, which is exactly the memory this is
+    trying to save.
+
+Sample call:
+    pools = Pool.from_collection(
+        py5.get_all_pools(expand_subcollections=True))
+    for pool in pools:
+        print(pool.name, pool.partition, len(pool.members))
+
+    node = Node(py5.get_node(name='Node Name'))
+    node.session = 'user-disabled'
+    py5.modify_node(**node.to_payload())
+
+Author: Corwin Brown
+"""
+
+try:
+    from sys import intern
+except ImportError:
+    pass
+
+
+# Keys the F5 adds to every object that it won't accept back in a PUT.
+READ_ONLY_KEYS = frozenset(['kind', 'selfLink', 'generation', 'fullPath'])
+
+# Keys whose values come from a short, fixed list. Interning them means
+#   thousands of objects share one 'Common' instead of keeping their own.
+INTERNED_KEYS = frozenset(['partition',
+                           'session',
+                           'state',
+                           'monitor',
+                           'loadBalancingMode',
+                           'ephemeral',
+                           'logging',
+                           'rateLimit',
+                           'allowNat',
+                           'allowSnat',
+                           'ignorePersistedWeight',
+                           'ipTosToClient',
+                           'ipTosToServer',
+                           'linkQosToClient',
+                           'linkQosToServer',
+                           'minUpMembersAction',
+                           'minUpMembersChecking',
+                           'queueOnConnectionLimit'])
+
+
+def _intern(key, value):
+    if key in INTERNED_KEYS and isinstance(value, str):
+        return intern(value)
+
+    return value
+
+
+def _skip_keys(read_only_keys, fields):
+    """
+    Keys that don't belong in a model's extra dict: the read-only ones
+        and the ones that already have a slot.
+    """
+
+    return read_only_keys | frozenset(key for _, key, _ in fields)
+
+
+class _Model(object):
+    __slots__ = ('_extra',)
+
+    # (attribute, payload key, default) for every field kept in a slot.
+    fields = ()
+    skip_keys = READ_ONLY_KEYS
+
+    def __init__(self, raw):
+        """
+        Constructor
+
+        Parameters:
+            raw -- A single object as returned by the REST API.
+        """
+
+        for attribute, key, default in self.fields:
+            setattr(self, attribute, _intern(key, raw.get(key, default)))
+
+        skip_keys = self.skip_keys
+        self._extra = dict((key, _intern(key, value))
+                           for key, value in raw.items()
+                           if key not in skip_keys and
+                           not key.endswith('Reference')) or None
+
+    @classmethod
+    def from_collection(cls, collection):
+        """
+        Wrap every entry of a collection response, e.g. the output of
+            get_all_pools() or get_all_nodes().
+        """
+
+        return [cls(item) for item in collection.get('items', [])]
+
+    def get(self, key, default=None):
+        """
+        Look up any field that doesn't have its own attribute.
+        """
+
+        if self._extra is None:
+            return default
+
+        return self._extra.get(key, default)
+
+    def to_payload(self):
+        """
+        Return a dict suitable for create_*/modify_*, e.g.:
+            py5.modify_pool(**pool.to_payload())
+        """
+
+        payload = dict(self._extra or ())
+        for attribute, key, _ in self.fields:
+            value = getattr(self, attribute)
+            if value is not None:
+                payload[key] = value
+
+        return payload
+
+    def _values(self):
+        return ([getattr(self, attribute) for attribute, _, _ in self.fields],
+                self._extra or {})
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self._values() == other._values()
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return '<{0} {1}/{2}>'.format(type(self).__name__,
+                                      self.partition,
+                                      self.name)
+
+
+class _MonitoredModel(_Model):
+    """
+    Shared by nodes and pool members, which both carry a monitor driven
+        session/state and a few fields the F5 fills in on its own.
+    """
+
+    __slots__ = ('name', 'partition', 'address', 'session', 'state')
+
+    fields = (('name', 'name', None),
+              ('partition', 'partition', 'Common'),
+              ('address', 'address', None),
+              ('session', 'session', None),
+              ('state', 'state', None))
+    skip_keys = _skip_keys(READ_ONLY_KEYS, fields)
+
+    # Filled in by the F5 and rejected on a PUT. Still readable via get().
+    generated_keys = frozenset(['ephemeral', 'fqdn'])
+
+    def to_payload(self):
+        """
+        Same as _Model.to_payload(), minus what a PUT won't take back.
+
+        GET reports the monitor's view ('monitor-enabled', 'up',
+            'unchecked', ...) but a PUT only accepts 'user-enabled' or
+            'user-disabled' for session and 'user-up' or 'user-down' for
+            state, so anything else is left out.
+        """
+
+        payload = super(_MonitoredModel, self).to_payload()
+        for key in self.generated_keys:
+            payload.pop(key, None)
+
+        for key in ('session', 'state'):
+            if key in payload and not payload[key].startswith('user-'):
+                del payload[key]
+
+        return payload
+
+
+class PoolMember(_MonitoredModel):
+    __slots__ = ()
+
+    def to_modify_payload(self):
+        """
+        Same as to_payload(), minus 'name' and 'partition', which
+            modify_member_in_pool() takes as the pool's name and
+            partition. e.g.:
+                py5.modify_member_in_pool(name=pool.name,
+                                          member_name=member.name,
+                                          partition=pool.partition,
+                                          **member.to_modify_payload())
+        """
+
+        payload = self.to_payload()
+        payload.pop('name', None)
+        payload.pop('partition', None)
+
+        return payload
+
+
+class Node(_MonitoredModel):
+    __slots__ = ()
+
+
+class Pool(_Model):
+    __slots__ = ('name',
+                 'partition',
+                 'load_balancing_mode',
+                 'monitor',
+                 '_members',
+                 '_send_members')
+
+    fields = (('name', 'name', None),
+              ('partition', 'partition', 'Common'),
+              ('load_balancing_mode', 'loadBalancingMode', None),
+              ('monitor', 'monitor', None))
+    skip_keys = _skip_keys(READ_ONLY_KEYS | frozenset(['members']), fields)
+
+    def __init__(self, raw):
+        """
+        Constructor
+
+        Parameters:
+            raw -- A single pool as returned by the REST API. Members
+                are picked up from either 'members' or an expanded
+                'membersReference' subcollection.
+        """
+
+        super(Pool, self).__init__(raw)
+
+        members = raw.get('members')
+        reference = raw.get('membersReference')
+        if members is None and reference and 'items' in reference:
+            members = reference['items']
+
+        # Only send members back if we actually got some to begin with.
+        self._send_members = members is not None
+        self._members = None
+        if members:
+            self._members = [PoolMember(member) for member in members]
+
+    @property
+    def members(self):
+        """
+        PoolMember objects for every member in the response.
+
+        NOTE: Pool getters only include members when called with
+            expand_subcollections=True. A pool fetched without them
+            leaves 'members' out of its payload, so modify_pool() won't
+            wipe them, until you either add to members or assign to it.
+        """
+
+        # Most pools from a plain get_all_pools() have none, so don't
+        #   pay for an empty list on each of them until someone asks.
+        if self._members is None:
+            self._members = list()
+
+        return self._members
+
+    @members.setter
+    def members(self, value):
+        """
+        Accepts PoolMember objects or plain member dicts.
+        """
+
+        self._members = [member if isinstance(member, PoolMember)
+                         else PoolMember(member)
+                         for member in value]
+        self._send_members = True
+
+    def to_payload(self):
+        payload = super(Pool, self).to_payload()
+        if self._send_members or self._members:
+            payload['members'] = [member.to_payload()
+                                  for member in self._members or ()]
+
+        return payload
+
+    def _values(self):
+        return super(Pool, self)._values(), self._members or []
+
+
+class Partition(_Model):
+    __slots__ = ('name', 'full_path')
+
+    # Folders are addressed by their full path, so it gets a slot.
+    fields = (('name', 'name', None),
+              ('full_path', 'fullPath', None))
+    skip_keys = _skip_keys(READ_ONLY_KEYS, fields)
+
+    def __repr__(self):
+        return '<{0} {1}>'.format(type(self).__name__, self.full_path)
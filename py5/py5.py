@@ -41,31 +41,52 @@ class iControlREST(object):
         self.icontrol.verify = verify
         self.icontrol.headers.update({'Content-Type': 'application/json'})
 
+    def _expand(self, expand_subcollections):
+        """
+        Query params asking the F5 to inline subcollections (like a
+            pool's members) instead of just linking to them.
+        """
+
+        if expand_subcollections:
+            return {'expandSubcollections': 'true'}
+
+        return None
+
     """
     Pool Methods
     """
 
-    def get_all_pools(self):
-        resp = self.icontrol.get('{0}/ltm/pool/'.format(self.url_base))
+    def get_all_pools(self, expand_subcollections=False):
+        """
+        Set expand_subcollections to include every pool's members
+            in the response.
+        """
+
+        resp = self.icontrol.get('{0}/ltm/pool/'.format(self.url_base),
+                                 params=self._expand(expand_subcollections))
         if not self.debug:
             resp.raise_for_status()
 
         return resp.json()
 
-    def get_all_pools_in_partition(self, partition='Common'):
+    def get_all_pools_in_partition(self,
+                                   partition='Common',
+                                   expand_subcollections=False):
         resp = self.icontrol.get('{0}/ltm/pool?$filter=partition eq {1}'
                                  .format(self.url_base,
-                                         partition))
+                                         partition),
+                                 params=self._expand(expand_subcollections))
         if not self.debug:
             resp.raise_for_status()
 
         return resp.json()
 
-    def get_pool(self, name, partition='Common'):
+    def get_pool(self, name, partition='Common', expand_subcollections=False):
         resp = self.icontrol.get('{0}/ltm/pool/~{1}~{2}/'
                                  .format(self.url_base,
                                          partition,
-                                         name))
+                                         name),
+                                 params=self._expand(expand_subcollections))
         if not self.debug:
             resp.raise_for_status()
 
@@ -18,5 +18,5 @@ setup(name='py5',
       packages=['py5', 'tests'],
       scripts=['bin/py5-cli'],
       install_requires=['requests==2.4.3', 'pyyaml==3.11'],
-      test_suite='tests.test_py5.py5Tests',
+      test_suite='tests',
       platform='all')
@@ -0,0 +1,194 @@
+import os
+import sys
+import unittest
+try:
+    from py5 import Pool, PoolMember, Node, Partition
+except ImportError:
+    sys.path.append(
+        os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+    from py5 import Pool, PoolMember, Node, Partition
+
+
+NODE = {
+    'kind': 'tm:ltm:node:nodestate',
+    'name': 'test_node',
+    'partition': 'Common',
+    'fullPath': '/Common/test_node',
+    'generation': 1,
+    'selfLink': 'https://localhost/mgmt/tm/ltm/node/~Common~test_node',
+    'address': '123.123.123.123',
+    'session': 'monitor-enabled',
+    'state': 'up'
+}
+
+MEMBER = {
+    'kind': 'tm:ltm:pool:members:membersstate',
+    'name': 'test_node:80',
+    'partition': 'Common',
+    'fullPath': '/Common/test_node:80',
+    'generation': 1,
+    'selfLink': 'https://localhost/mgmt/tm/ltm/pool/~Common~test_pool'
+                '/members/~Common~test_node:80',
+    'address': '123.123.123.123',
+    'session': 'monitor-enabled',
+    'state': 'up'
+}
+
+POOL = {
+    'kind': 'tm:ltm:pool:poolstate',
+    'name': 'test_pool',
+    'partition': 'Common',
+    'fullPath': '/Common/test_pool',
+    'generation': 1,
+    'selfLink': 'https://localhost/mgmt/tm/ltm/pool/~Common~test_pool',
+    'loadBalancingMode': 'round-robin',
+    'membersReference': {
+        'link': 'https://localhost/mgmt/tm/ltm/pool/~Common~test_pool'
+                '/members',
+        'isSubcollection': True,
+        'items': [MEMBER]
+    }
+}
+
+PARTITION = {
+    'kind': 'tm:sys:folder:folderstate',
+    'name': 'test_partition',
+    'fullPath': '/test_partition',
+    'generation': 1,
+    'selfLink': 'https://localhost/mgmt/tm/sys/folder/~test_partition'
+}
+
+
+class ModelTests(unittest.TestCase):
+    def test_node_fields(self):
+        node = Node(NODE)
+        self.assertEqual('test_node', node.name)
+        self.assertEqual('Common', node.partition)
+        self.assertEqual('123.123.123.123', node.address)
+        self.assertEqual('monitor-enabled', node.session)
+        self.assertEqual('up', node.state)
+
+    def test_node_drops_read_only_keys(self):
+        payload = Node(NODE).to_payload()
+        for key in ('kind', 'selfLink', 'generation', 'fullPath'):
+            self.assertNotIn(key, payload)
+
+    def test_node_round_trip(self):
+        node = Node(NODE)
+        node.session = 'user-disabled'
+        payload = node.to_payload()
+        self.assertEqual('user-disabled', payload['session'])
+        self.assertEqual(payload, Node(payload).to_payload())
+
+    def test_node_payload_drops_monitor_status(self):
+        payload = Node(dict(NODE, ephemeral='false', fqdn={})).to_payload()
+        for key in ('session', 'state', 'ephemeral', 'fqdn'):
+            self.assertNotIn(key, payload)
+        self.assertEqual({'name': 'test_node',
+                          'partition': 'Common',
+                          'address': '123.123.123.123'}, payload)
+
+    def test_node_payload_keeps_user_status(self):
+        node = Node(NODE)
+        node.session = 'user-disabled'
+        node.state = 'user-down'
+        payload = node.to_payload()
+        self.assertEqual('user-disabled', payload['session'])
+        self.assertEqual('user-down', payload['state'])
+
+    def test_node_does_not_modify_response(self):
+        raw = dict(NODE)
+        Node(raw).session = 'user-disabled'
+        self.assertEqual(NODE, raw)
+
+    def test_from_collection(self):
+        nodes = Node.from_collection({'items': [NODE, NODE]})
+        self.assertEqual(2, len(nodes))
+        self.assertEqual([], Node.from_collection({}))
+
+    def test_partition_defaults_to_common(self):
+        self.assertEqual('Common', Node({'name': 'test_node'}).partition)
+
+    def test_unknown_field(self):
+        node = Node(dict(NODE, ratio=2))
+        self.assertEqual(2, node.get('ratio'))
+        self.assertEqual(2, node.to_payload()['ratio'])
+        self.assertIsNone(node.get('bogus'))
+        self.assertIsNone(Node(NODE).get('ratio'))
+
+    def test_slots(self):
+        self.assertRaises(AttributeError, setattr, Node(NODE), 'bogus', 1)
+
+    def test_pool_members(self):
+        pool = Pool(POOL)
+        self.assertEqual('round-robin', pool.load_balancing_mode)
+        self.assertEqual([PoolMember(MEMBER)], pool.members)
+        self.assertEqual('test_node:80', pool.members[0].name)
+        self.assertEqual('up', pool.members[0].state)
+
+    def test_pool_without_members(self):
+        pool = Pool({'name': 'test_pool'})
+        self.assertEqual([], pool.members)
+        self.assertEqual({'name': 'test_pool', 'partition': 'Common'},
+                         pool.to_payload())
+        pool.members = []
+        self.assertEqual([], pool.to_payload()['members'])
+
+    def test_pool_without_expanded_members(self):
+        raw = dict(POOL, membersReference={'link': 'https://localhost/'})
+        pool = Pool(raw)
+        self.assertEqual([], pool.members)
+        self.assertNotIn('members', pool.to_payload())
+
+    def test_pool_round_trip(self):
+        pool = Pool(POOL)
+        pool.members[0].session = 'user-disabled'
+        payload = pool.to_payload()
+        self.assertNotIn('membersReference', payload)
+        self.assertEqual('user-disabled', payload['members'][0]['session'])
+        self.assertEqual(payload, Pool(payload).to_payload())
+
+    def test_pool_payload_members_are_sendable(self):
+        payload = Pool(POOL).to_payload()
+        self.assertEqual([{'name': 'test_node:80',
+                           'partition': 'Common',
+                           'address': '123.123.123.123'}],
+                         payload['members'])
+
+    def test_pool_equality(self):
+        self.assertEqual(Pool(POOL), Pool(POOL))
+        pool = Pool(POOL)
+        pool.members[0].session = 'user-disabled'
+        self.assertNotEqual(Pool(POOL), pool)
+
+    def test_pool_append_member(self):
+        pool = Pool({'name': 'test_pool'})
+        pool.members.append(PoolMember(MEMBER))
+        self.assertEqual([PoolMember(MEMBER).to_payload()],
+                         pool.to_payload()['members'])
+
+    def test_pool_assign_member_dicts(self):
+        pool = Pool({'name': 'test_pool'})
+        pool.members = [{'name': 'test_node:80'}]
+        self.assertEqual([PoolMember({'name': 'test_node:80'})], pool.members)
+        self.assertEqual([{'name': 'test_node:80', 'partition': 'Common'}],
+                         pool.to_payload()['members'])
+
+    def test_pool_member_modify_payload(self):
+        member = PoolMember(MEMBER)
+        member.session = 'user-disabled'
+        payload = member.to_modify_payload()
+        self.assertNotIn('name', payload)
+        self.assertNotIn('partition', payload)
+        self.assertEqual('user-disabled', payload['session'])
+
+    def test_partition_keeps_full_path(self):
+        partition = Partition(PARTITION)
+        self.assertEqual('test_partition', partition.name)
+        self.assertEqual('/test_partition', partition.full_path)
+        self.assertNotIn('selfLink', partition.to_payload())
+
+    def test_interned_values(self):
+        first = Node(dict(NODE, partition=''.join(['Com', 'mon'])))
+        second = Node(dict(NODE, partition=''.join(['Com', 'mon'])))
+        self.assertIs(first.partition, second.partition)
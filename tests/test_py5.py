@@ -156,3 +156,20 @@ class py5Tests(unittest.TestCase):
                 name='test_remove_members_pool')['items'])
         self.py5.delete_node('test_remove_members_node')
         self.py5.delete_pool('test_remove_members_pool')
+
+    def test_get_pool_expanded(self):
+        self.py5.create_pool(name='test_expand_pool')
+        self.py5.create_node(name='test_expand_node',
+                             address='123.123.123.123')
+        self.py5.add_members_to_pool(
+            target_pool='test_expand_pool',
+            new_members=[{'name': 'test_expand_node:80'}])
+        self.assertEqual(
+            'test_expand_node:80',
+            self.py5.get_pool(name='test_expand_pool',
+                              expand_subcollections=True)
+            ['membersReference']['items'][0]['name'])
+        self.py5.remove_member_from_pool(target_pool='test_expand_pool',
+                                         member_name='test_expand_node')
+        self.py5.delete_node('test_expand_node')
+        self.py5.delete_pool('test_expand_pool')